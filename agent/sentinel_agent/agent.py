@@ -14,7 +14,7 @@ def collect():
     net = psutil.net_io_counters()
     return {
         "server_name"   : SERVER_NAME,
-        "cpu_percent"   : psutil.cpu_percent(interval=1),
+        "cpu_percent"   : psutil.cpu_percent(interval=None),  # avg since last sample
         "memory_percent": psutil.virtual_memory().percent,
         "disk_percent"  : psutil.disk_usage("/").percent,
         "net_bytes_sent": net.bytes_sent,
@@ -24,6 +24,8 @@ def collect():
 
 async def run():
     print(f"[Sentinel Agent] Starting — server: {SERVER_NAME}, interval: {INTERVAL}s")
+    psutil.cpu_percent(interval=None)  # prime the counter; its own reading is meaningless
+    await asyncio.sleep(INTERVAL)      # so the first sample covers a full interval
     async with httpx.AsyncClient() as client:
         while True:
             try:
@@ -3,6 +3,8 @@ from pydantic_settings import BaseSettings
 class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5        # persistent connections per worker
+    DB_MAX_OVERFLOW: int = 10    # extra connections allowed under burst
 
     # Redis
     REDIS_URL: str
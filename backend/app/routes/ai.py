@@ -61,12 +61,26 @@ async def recommendations(
     current_user: User = Depends(get_current_user),
     db: AsyncSession   = Depends(get_db)
 ):
-    # Fetch averages from last 60 metric rows for this server
+    # Count open incidents for this server
+    open_incidents = (
+        select(func.count())
+        .select_from(Incident)
+        .where(
+            Incident.user_id     == current_user.id,
+            Incident.server_name == body.server_name,
+            Incident.status      == IncidentStatus.open
+        )
+        .scalar_subquery()
+    )
+
+    # Fetch averages across all metric rows for this server, plus the
+    # open incident count, in a single round-trip
     result = await db.execute(
         select(
             func.avg(Metric.cpu_percent).label("cpu_avg"),
             func.avg(Metric.memory_percent).label("memory_avg"),
             func.avg(Metric.disk_percent).label("disk_avg"),
+            open_incidents.label("incident_count"),
         ).where(
             Metric.user_id     == current_user.id,
             Metric.server_name == body.server_name
@@ -74,21 +88,11 @@ async def recommendations(
     )
     row = result.one()
 
-    # Count open incidents for this server
-    inc_result = await db.execute(
-        select(func.count()).where(
-            Incident.user_id     == current_user.id,
-            Incident.server_name == body.server_name,
-            Incident.status      == IncidentStatus.open
-        )
-    )
-    incident_count = inc_result.scalar()
-
     ai_result = await recommend(
         body.server_name,
-        row.cpu_avg    or 0.0,
-        row.memory_avg or 0.0,
-        row.disk_avg   or 0.0,
-        incident_count or 0
+        row.cpu_avg        or 0.0,
+        row.memory_avg     or 0.0,
+        row.disk_avg       or 0.0,
+        row.incident_count or 0
     )
     return {"result": ai_result}
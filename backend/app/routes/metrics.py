@@ -1,11 +1,11 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.database import get_db
 from app.dependencies import get_current_user, get_current_api_key
 from app.models.user import User, APIKey
 from app.schemas.metric import MetricIngest, MetricResponse
 from app.services.metric_service import (
-    save_metric, cache_latest, get_cached_latest, get_history, check_anomalies
+    save_metric, cache_latest, get_cached_latest_raw, get_history, check_anomalies
 )
 
 router = APIRouter()
@@ -29,8 +29,11 @@ async def latest(
     server_name: str,
     current_user: User = Depends(get_current_user),
 ):
-    data = await get_cached_latest(str(current_user.id), server_name)
-    return data or {"status": "no data yet"}
+    data = await get_cached_latest_raw(str(current_user.id), server_name)
+    if not data:
+        return {"status": "no data yet"}
+    # Already JSON in Redis — pass it through instead of decoding and re-encoding
+    return Response(content=data, media_type="application/json")
 
 # ── Dashboard: get last N data points for charts ─────────────────────
 @router.get("/history", response_model=list[MetricResponse])
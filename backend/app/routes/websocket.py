@@ -1,5 +1,4 @@
 import asyncio
-import json
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect, Query
 from app.services.auth_service import decode_access_token
 from app.services.ws_manager import manager
@@ -22,12 +21,13 @@ async def live(
     await manager.connect(user_id, ws)
     r = await get_redis()
 
+    key = f"latest:{user_id}:{server_name}"
+
     try:
         while True:
-            key  = f"latest:{user_id}:{server_name}"
             data = await r.get(key)
             if data:
-                await ws.send_json(json.loads(data))
+                await ws.send_text(data)   # already JSON — no decode/re-encode
             await asyncio.sleep(3)   # push every 3 seconds
     except WebSocketDisconnect:
         manager.disconnect(user_id, ws)
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
@@ -15,8 +15,7 @@ class IncidentResponse(BaseModel):
     created_at:   datetime
     resolved_at:  Optional[datetime]
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class ResolveRequest(BaseModel):
     action_taken: Optional[str] = None
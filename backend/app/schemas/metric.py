@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 from datetime import datetime
 
@@ -21,5 +21,4 @@ class MetricResponse(BaseModel):
     net_bytes_recv: float
     recorded_at:    datetime
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True)
\ No newline at end of file
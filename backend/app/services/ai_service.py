@@ -1,11 +1,29 @@
+import hashlib
 import httpx
+from redis.exceptions import RedisError
 from app.config import settings
+from app.redis_client import get_redis
 
 HEADERS = {
     "Authorization": f"Bearer {settings.GROK_API_KEY}",
     "Content-Type":  "application/json",
 }
 
+EXPLAIN_CACHE_TTL = 60 * 60  # identical logs reuse an explanation for 1 hour
+
+# Reused across calls so connections (and TLS sessions) to Grok stay pooled
+_client = None
+
+def get_http_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=settings.GROK_API_URL,
+            headers=HEADERS,
+            timeout=30,
+        )
+    return _client
+
 # ── Core Grok caller ──────────────────────────────────────────────────
 async def call_grok(system_prompt: str, user_message: str) -> str:
     payload = {
@@ -16,14 +34,10 @@ async def call_grok(system_prompt: str, user_message: str) -> str:
         ],
         "max_tokens": 1024,
     }
-    async with httpx.AsyncClient(timeout=30) as client:
-        resp = await client.post(
-            f"{settings.GROK_API_URL}/chat/completions",
-            headers=HEADERS,
-            json=payload,
-        )
-        resp.raise_for_status()
-        return resp.json()["choices"][0]["message"]["content"]
+    client = get_http_client()
+    resp = await client.post("/chat/completions", json=payload)
+    resp.raise_for_status()
+    return resp.json()["choices"][0]["message"]["content"]
 
 # ── 1. Root Cause Analysis ────────────────────────────────────────────
 async def analyze_incident(title: str, description: str, server_name: str) -> str:
@@ -52,7 +66,24 @@ async def explain_logs(log_text: str, server_name: str) -> str:
         f"Logs:\n{log_text[:3000]}\n\n"   # cap at 3000 chars to save tokens
         "Explain what happened in these logs."
     )
-    return await call_grok(system, message)
+    # Agents tend to resend the same log excerpts — don't pay Grok twice.
+    # The cache is best-effort: if Redis is down, just call Grok.
+    key = "explain:" + hashlib.sha256(f"{system}\0{message}".encode()).hexdigest()
+    try:
+        r = await get_redis()
+        cached = await r.get(key)
+        if cached:
+            return cached
+    except RedisError:
+        r = None
+
+    result = await call_grok(system, message)
+    if r is not None:
+        try:
+            await r.set(key, result, ex=EXPLAIN_CACHE_TTL)
+        except RedisError:
+            pass
+    return result
 
 # ── 3. Chat Assistant ─────────────────────────────────────────────────
 async def chat(message: str, server_name: str = None) -> str:
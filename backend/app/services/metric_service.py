@@ -14,6 +14,11 @@ THRESHOLDS = {
     "disk_percent":   90.0,
 }
 
+# e.g. "cpu_percent" → "High Cpu Percent detected", built once instead of per sample
+INCIDENT_TITLES = {
+    field: f"High {field.replace('_', ' ').title()} detected" for field in THRESHOLDS
+}
+
 # ── Save metric to PostgreSQL ─────────────────────────────────────────
 async def save_metric(db: AsyncSession, user_id: str, data: MetricIngest) -> Metric:
     metric = Metric(
@@ -28,7 +33,8 @@ async def save_metric(db: AsyncSession, user_id: str, data: MetricIngest) -> Met
     )
     db.add(metric)
     await db.commit()
-    await db.refresh(metric)
+    # No refresh: id is generated client-side and the session doesn't
+    # expire on commit, so re-selecting the row would be a wasted round-trip
     return metric
 
 # ── Cache latest metric in Redis (for live dashboard) ─────────────────
@@ -37,11 +43,10 @@ async def cache_latest(user_id: str, server_name: str, data: dict):
     key = f"latest:{user_id}:{server_name}"
     await r.set(key, json.dumps(data, default=str), ex=60)  # expires in 60s
 
-async def get_cached_latest(user_id: str, server_name: str) -> dict | None:
+async def get_cached_latest_raw(user_id: str, server_name: str) -> str | None:
     r = await get_redis()
     key = f"latest:{user_id}:{server_name}"
-    val = await r.get(key)
-    return json.loads(val) if val else None
+    return await r.get(key)
 
 # ── Get metric history from DB ────────────────────────────────────────
 async def get_history(db: AsyncSession, user_id: str, server_name: str, limit: int = 60):
@@ -55,16 +60,20 @@ async def get_history(db: AsyncSession, user_id: str, server_name: str, limit: i
 
 # ── Check thresholds and create incident if breached ──────────────────
 async def check_anomalies(db: AsyncSession, user_id: str, data: MetricIngest):
+    incidents = []
+    now = datetime.utcnow()  # one timestamp for every incident raised by this sample
     for field, threshold in THRESHOLDS.items():
         value = getattr(data, field)
         if value >= threshold:
-            title = f"High {field.replace('_', ' ').title()} detected"
-            incident = Incident(
+            incidents.append(Incident(
                 user_id     = user_id,
                 server_name = data.server_name,
-                title       = title,
+                title       = INCIDENT_TITLES[field],
                 description = f"{field} is at {value:.1f}% (threshold: {threshold}%)",
                 status      = IncidentStatus.open,
-            )
-            db.add(incident)
-    await db.commit()
\ No newline at end of file
+                created_at  = now,
+            ))
+    # Most samples are healthy — skip the COMMIT round-trip when nothing breached
+    if incidents:
+        db.add_all(incidents)
+        await db.commit()
\ No newline at end of file